@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from io import BytesIO
-from typing import Callable, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from .typing import (
     ASGIFramework,
@@ -12,11 +13,86 @@ from .typing import (
     WSGIFramework,
 )
 
+# Maps a header name to its CGI form, uppercasing and replacing "-" with "_"
+_HEADER_TRANS = bytes.maketrans(b"abcdefghijklmnopqrstuvwxyz-", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ_")
+
+# The WSGI environ entries that are the same for every request
+_ENVIRON_TEMPLATE: Dict[str, Any] = {
+    "wsgi.version": (1, 0),
+    "wsgi.multithread": True,
+    "wsgi.multiprocess": True,
+    "wsgi.run_once": False,
+}
+
+# The CGI environ names of commonly sent headers, to skip the conversion
+_COMMON_CGI_NAMES = {
+    b"content-length": "CONTENT_LENGTH",
+    b"content-type": "CONTENT_TYPE",
+    **{
+        name: "HTTP_" + name.translate(_HEADER_TRANS).decode("latin1")
+        for name in (
+            b"accept",
+            b"accept-encoding",
+            b"accept-language",
+            b"authorization",
+            b"cache-control",
+            b"connection",
+            b"cookie",
+            b"dnt",
+            b"forwarded",
+            b"host",
+            b"if-modified-since",
+            b"if-none-match",
+            b"origin",
+            b"pragma",
+            b"referer",
+            b"sec-ch-ua",
+            b"sec-ch-ua-mobile",
+            b"sec-ch-ua-platform",
+            b"sec-fetch-dest",
+            b"sec-fetch-mode",
+            b"sec-fetch-site",
+            b"sec-fetch-user",
+            b"upgrade-insecure-requests",
+            b"user-agent",
+            b"x-forwarded-for",
+            b"x-forwarded-host",
+            b"x-forwarded-proto",
+            b"x-real-ip",
+            b"x-request-id",
+            b"x-requested-with",
+        )
+    },
+}
+
+_SERVER_PROTOCOLS = {"1.0": "HTTP/1.0", "1.1": "HTTP/1.1", "2": "HTTP/2", "3": "HTTP/3"}
+
 
 class InvalidPathError(Exception):
     pass
 
 
+class _StartResponse:
+    __slots__ = ("status_code", "headers")
+
+    def __init__(self) -> None:
+        self.status_code: Optional[int] = None
+        self.headers: List[Tuple[bytes, bytes]] = []
+
+    def __call__(
+        self,
+        status: str,
+        response_headers: List[Tuple[str, str]],
+        exc_info: Optional[Exception] = None,
+    ) -> None:
+        raw, _ = status.split(" ", 1)
+        self.status_code = int(raw)
+        self.headers = [
+            (name.encode("ascii").lower(), value.encode("ascii"))
+            for name, value in response_headers
+        ]
+
+
 class ASGIWrapper:
     def __init__(self, app: ASGIFramework) -> None:
         self.app = app
@@ -43,16 +119,39 @@ class WSGIWrapper:
         send: ASGISendCallable,
         sync_spawn: Callable,
     ) -> None:
-        if scope["type"] == "http":
-            status_code, headers, body = await self.handle_http(scope, receive, send, sync_spawn)
-            await send({"type": "http.response.start", "status": status_code, "headers": headers})  # type: ignore # noqa: E501
-            await send({"type": "http.response.body", "body": body})  # type: ignore
-        elif scope["type"] == "websocket":
-            await send({"type": "websocket.close"})  # type: ignore
-        elif scope["type"] == "lifespan":
-            return
-        else:
+        handler = _SCOPE_HANDLERS.get(scope["type"])
+        if handler is None:
             raise Exception(f"Unknown scope type, {scope['type']}")
+        await handler(self, scope, receive, send, sync_spawn)
+
+    async def _handle_http_scope(
+        self,
+        scope: HTTPScope,
+        receive: ASGIReceiveCallable,
+        send: ASGISendCallable,
+        sync_spawn: Callable,
+    ) -> None:
+        status_code, headers, body = await self.handle_http(scope, receive, send, sync_spawn)
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body})  # type: ignore
+
+    async def _handle_websocket_scope(
+        self,
+        scope: Scope,
+        receive: ASGIReceiveCallable,
+        send: ASGISendCallable,
+        sync_spawn: Callable,
+    ) -> None:
+        await send({"type": "websocket.close"})  # type: ignore
+
+    async def _handle_lifespan_scope(
+        self,
+        scope: Scope,
+        receive: ASGIReceiveCallable,
+        send: ASGISendCallable,
+        sync_spawn: Callable,
+    ) -> None:
+        return
 
     async def handle_http(
         self,
@@ -61,15 +160,20 @@ class WSGIWrapper:
         send: ASGISendCallable,
         sync_spawn: Callable,
     ) -> Tuple[int, list, bytes]:
-        body = bytearray()
+        chunks: List[bytes] = []
+        total = 0
         while True:
             message = await receive()
-            body.extend(message.get("body", b""))  # type: ignore
-            if len(body) > self.max_body_size:
+            chunk = message.get("body", b"")
+            chunks.append(chunk)  # type: ignore
+            total += len(chunk)  # type: ignore
+            if total > self.max_body_size:
                 return 400, [], b""
             if not message.get("more_body"):
                 break
 
+        body = b"".join(chunks)
+
         try:
             environ = _build_environ(scope, body)
         except InvalidPathError:
@@ -78,70 +182,73 @@ class WSGIWrapper:
             return await sync_spawn(self.run_app, environ)
 
     def run_app(self, environ: dict) -> Tuple[int, list, bytes]:
-        headers: List[Tuple[bytes, bytes]]
-        status_code: Optional[int] = None
-
-        def start_response(
-            status: str,
-            response_headers: List[Tuple[str, str]],
-            exc_info: Optional[Exception] = None,
-        ) -> None:
-            nonlocal headers, status_code
-
-            raw, _ = status.split(" ", 1)
-            status_code = int(raw)
-            headers = [
-                (name.lower().encode("ascii"), value.encode("ascii"))
-                for name, value in response_headers
-            ]
-
-        body = bytearray()
+        start_response = _StartResponse()
+        parts: List[bytes] = []
         for output in self.app(environ, start_response):
-            body.extend(output)
-        return status_code, headers, body
+            parts.append(output)
+        if start_response.status_code is None:
+            raise Exception("WSGI app did not call start_response")
+        return start_response.status_code, start_response.headers, b"".join(parts)
+
+
+_SCOPE_HANDLERS: Dict[str, Callable[..., Awaitable[None]]] = {
+    "http": WSGIWrapper._handle_http_scope,
+    "websocket": WSGIWrapper._handle_websocket_scope,
+    "lifespan": WSGIWrapper._handle_lifespan_scope,
+}
 
 
 def _build_environ(scope: HTTPScope, body: bytes) -> dict:
     server = scope.get("server") or ("localhost", 80)
     path = scope["path"]
     script_name = scope.get("root_path", "")
-    if path.startswith(script_name):
-        path = path[len(script_name) :]
-        path = path if path != "" else "/"
+    if not script_name:
+        path = path or "/"
+    elif path.startswith(script_name):
+        path = path[len(script_name) :] or "/"
     else:
         raise InvalidPathError()
 
-    environ = {
-        "REQUEST_METHOD": scope["method"],
-        "SCRIPT_NAME": script_name.encode("utf8").decode("latin1"),
-        "PATH_INFO": path.encode("utf8").decode("latin1"),
-        "QUERY_STRING": scope["query_string"].decode("ascii"),
-        "SERVER_NAME": server[0],
-        "SERVER_PORT": server[1],
-        "SERVER_PROTOCOL": "HTTP/%s" % scope["http_version"],
-        "wsgi.version": (1, 0),
-        "wsgi.url_scheme": scope.get("scheme", "http"),
-        "wsgi.input": BytesIO(body),
-        "wsgi.errors": BytesIO(),
-        "wsgi.multithread": True,
-        "wsgi.multiprocess": True,
-        "wsgi.run_once": False,
-    }
-
-    if "client" in scope:
-        environ["REMOTE_ADDR"] = scope["client"][0]
+    environ = _ENVIRON_TEMPLATE.copy()
+    environ["REQUEST_METHOD"] = scope["method"]
+    environ["SCRIPT_NAME"] = _utf8_to_latin1(script_name)
+    environ["PATH_INFO"] = _utf8_to_latin1(path)
+    environ["QUERY_STRING"] = scope["query_string"].decode("ascii")
+    environ["SERVER_NAME"] = server[0]
+    environ["SERVER_PORT"] = server[1]
+    http_version = scope["http_version"]
+    environ["SERVER_PROTOCOL"] = _SERVER_PROTOCOLS.get(http_version) or "HTTP/%s" % http_version
+    environ["wsgi.url_scheme"] = scope.get("scheme", "http")
+    environ["wsgi.input"] = BytesIO(body)
+    environ["wsgi.errors"] = BytesIO()
+
+    client = scope.get("client")
+    if client is not None:
+        environ["REMOTE_ADDR"] = client[0]
 
     for raw_name, raw_value in scope.get("headers", []):
-        name = raw_name.decode("latin1")
-        if name == "content-length":
-            corrected_name = "CONTENT_LENGTH"
-        elif name == "content-type":
-            corrected_name = "CONTENT_TYPE"
-        else:
-            corrected_name = "HTTP_%s" % name.upper().replace("-", "_")
+        corrected_name = _COMMON_CGI_NAMES.get(raw_name) or _cgi_name(raw_name)
         # HTTPbis say only ASCII chars are allowed in headers, but we latin1 just in case
         value = raw_value.decode("latin1")
         if corrected_name in environ:
-            value = environ[corrected_name] + "," + value  # type: ignore
+            value = environ[corrected_name] + "," + value
         environ[corrected_name] = value
     return environ
+
+
+@lru_cache(maxsize=256)
+def _cgi_name(raw_name: bytes) -> str:
+    if raw_name == b"content-length":
+        return "CONTENT_LENGTH"
+    elif raw_name == b"content-type":
+        return "CONTENT_TYPE"
+    else:
+        return "HTTP_" + raw_name.translate(_HEADER_TRANS).decode("latin1")
+
+
+def _utf8_to_latin1(value: str) -> str:
+    # PEP 3333 requires the UTF-8 bytes be presented as latin1, which
+    # is a no-op for ASCII strings.
+    if value.isascii():
+        return value
+    return value.encode("utf8").decode("latin1")
@@ -1,12 +1,35 @@
 from __future__ import annotations
 
 import asyncio
+import sys
+from collections import deque
 from functools import partial
+from typing import Any, Callable, Deque, Dict
 
 from ..config import Config
-from ..typing import AppWrapper, ASGIReceiveEvent, ASGISendEvent, LifespanScope
+from ..typing import (
+    AppWrapper,
+    ASGIReceiveEvent,
+    ASGISendEvent,
+    LifespanScope,
+    LifespanShutdownCompleteEvent,
+    LifespanShutdownFailedEvent,
+    LifespanStartupCompleteEvent,
+    LifespanStartupFailedEvent,
+)
 from ..utils import LifespanFailureError, LifespanTimeoutError
 
+if sys.version_info >= (3, 11):
+
+    async def _wait_for_event(event: asyncio.Event, timeout: float) -> None:
+        async with asyncio.timeout(timeout):
+            await event.wait()
+
+else:
+
+    async def _wait_for_event(event: asyncio.Event, timeout: float) -> None:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+
 
 class UnexpectedMessageError(Exception):
     pass
@@ -18,7 +41,10 @@ class Lifespan:
         self.config = config
         self.startup = asyncio.Event()
         self.shutdown = asyncio.Event()
-        self.app_queue: asyncio.Queue = asyncio.Queue(config.max_app_queue_size)
+        # Lifespan has a single producer and consumer of a couple of
+        # events, so a deque and event suffice rather than a Queue.
+        self._app_events: Deque[ASGIReceiveEvent] = deque()
+        self._app_event_available = asyncio.Event()
         self.supported = True
         self.loop = loop
 
@@ -38,29 +64,32 @@ class Lifespan:
             # Lifespan failures should crash the server
             raise
         except Exception:
-            self.supported = False
-            if not self.startup.is_set():
-                await self.config.log.warning(
-                    "ASGI Framework Lifespan error, continuing without Lifespan support"
-                )
-            elif not self.shutdown.is_set():
-                await self.config.log.exception(
-                    "ASGI Framework Lifespan error, shutdown without Lifespan support"
-                )
-            else:
-                await self.config.log.exception("ASGI Framework Lifespan errored after shutdown.")
+            await self._handle_lifespan_error()
         finally:
             self.startup.set()
             self.shutdown.set()
 
+    async def _handle_lifespan_error(self) -> None:
+        self.supported = False
+        if not self.startup.is_set():
+            await self.config.log.warning(
+                "ASGI Framework Lifespan error, continuing without Lifespan support"
+            )
+        elif not self.shutdown.is_set():
+            await self.config.log.exception(
+                "ASGI Framework Lifespan error, shutdown without Lifespan support"
+            )
+        else:
+            await self.config.log.exception("ASGI Framework Lifespan errored after shutdown.")
+
     async def wait_for_startup(self) -> None:
         await self._started.wait()
         if not self.supported:
             return
 
-        await self.app_queue.put({"type": "lifespan.startup"})
+        self._put({"type": "lifespan.startup"})
         try:
-            await asyncio.wait_for(self.startup.wait(), timeout=self.config.startup_timeout)
+            await _wait_for_event(self.startup, self.config.startup_timeout)
         except asyncio.TimeoutError as error:
             raise LifespanTimeoutError("startup") from error
 
@@ -69,25 +98,46 @@ class Lifespan:
         if not self.supported:
             return
 
-        await self.app_queue.put({"type": "lifespan.shutdown"})
+        self._put({"type": "lifespan.shutdown"})
         try:
-            await asyncio.wait_for(self.shutdown.wait(), timeout=self.config.shutdown_timeout)
+            await _wait_for_event(self.shutdown, self.config.shutdown_timeout)
         except asyncio.TimeoutError as error:
             raise LifespanTimeoutError("shutdown") from error
 
     async def asgi_receive(self) -> ASGIReceiveEvent:
-        return await self.app_queue.get()
+        while not self._app_events:
+            self._app_event_available.clear()
+            await self._app_event_available.wait()
+        return self._app_events.popleft()
 
     async def asgi_send(self, message: ASGISendEvent) -> None:
-        if message["type"] == "lifespan.startup.complete":
-            self.startup.set()
-        elif message["type"] == "lifespan.shutdown.complete":
-            self.shutdown.set()
-        elif message["type"] == "lifespan.startup.failed":
-            self.startup.set()
-            raise LifespanFailureError("startup", message["message"])
-        elif message["type"] == "lifespan.shutdown.failed":
-            self.shutdown.set()
-            raise LifespanFailureError("shutdown", message["message"])
-        else:
+        handler = _LIFESPAN_HANDLERS.get(message["type"])
+        if handler is None:
             raise UnexpectedMessageError(message["type"])
+        handler(self, message)
+
+    def _startup_complete(self, message: LifespanStartupCompleteEvent) -> None:
+        self.startup.set()
+
+    def _shutdown_complete(self, message: LifespanShutdownCompleteEvent) -> None:
+        self.shutdown.set()
+
+    def _startup_failed(self, message: LifespanStartupFailedEvent) -> None:
+        self.startup.set()
+        raise LifespanFailureError("startup", message["message"])
+
+    def _shutdown_failed(self, message: LifespanShutdownFailedEvent) -> None:
+        self.shutdown.set()
+        raise LifespanFailureError("shutdown", message["message"])
+
+    def _put(self, event: ASGIReceiveEvent) -> None:
+        self._app_events.append(event)
+        self._app_event_available.set()
+
+
+_LIFESPAN_HANDLERS: Dict[str, Callable[[Lifespan, Any], None]] = {
+    "lifespan.startup.complete": Lifespan._startup_complete,
+    "lifespan.shutdown.complete": Lifespan._shutdown_complete,
+    "lifespan.startup.failed": Lifespan._startup_failed,
+    "lifespan.shutdown.failed": Lifespan._shutdown_failed,
+}
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+from typing import Any, Callable, Dict
+
 import trio
 
 from ..config import Config
-from ..typing import AppWrapper, ASGIReceiveEvent, ASGISendEvent, LifespanScope
+from ..typing import (
+    AppWrapper,
+    ASGIReceiveEvent,
+    ASGISendEvent,
+    LifespanScope,
+    LifespanShutdownCompleteEvent,
+    LifespanShutdownFailedEvent,
+    LifespanStartupCompleteEvent,
+    LifespanStartupFailedEvent,
+)
 from ..utils import LifespanFailureError, LifespanTimeoutError
 
 
@@ -33,23 +44,26 @@ class Lifespan:
             # Lifespan failures should crash the server
             raise
         except Exception:
-            self.supported = False
-            if not self.startup.is_set():
-                await self.config.log.warning(
-                    "ASGI Framework Lifespan error, continuing without Lifespan support"
-                )
-            elif not self.shutdown.is_set():
-                await self.config.log.exception(
-                    "ASGI Framework Lifespan error, shutdown without Lifespan support"
-                )
-            else:
-                await self.config.log.exception("ASGI Framework Lifespan errored after shutdown.")
+            await self._handle_lifespan_error()
         finally:
             self.startup.set()
             self.shutdown.set()
             await self.app_send_channel.aclose()
             await self.app_receive_channel.aclose()
 
+    async def _handle_lifespan_error(self) -> None:
+        self.supported = False
+        if not self.startup.is_set():
+            await self.config.log.warning(
+                "ASGI Framework Lifespan error, continuing without Lifespan support"
+            )
+        elif not self.shutdown.is_set():
+            await self.config.log.exception(
+                "ASGI Framework Lifespan error, shutdown without Lifespan support"
+            )
+        else:
+            await self.config.log.exception("ASGI Framework Lifespan errored after shutdown.")
+
     async def wait_for_startup(self) -> None:
         if not self.supported:
             return
@@ -76,13 +90,27 @@ class Lifespan:
         return await self.app_receive_channel.receive()
 
     async def asgi_send(self, message: ASGISendEvent) -> None:
-        if message["type"] == "lifespan.startup.complete":
-            self.startup.set()
-        elif message["type"] == "lifespan.shutdown.complete":
-            self.shutdown.set()
-        elif message["type"] == "lifespan.startup.failed":
-            raise LifespanFailureError("startup", message["message"])
-        elif message["type"] == "lifespan.shutdown.failed":
-            raise LifespanFailureError("shutdown", message["message"])
-        else:
+        handler = _LIFESPAN_HANDLERS.get(message["type"])
+        if handler is None:
             raise UnexpectedMessageError(message["type"])
+        handler(self, message)
+
+    def _startup_complete(self, message: LifespanStartupCompleteEvent) -> None:
+        self.startup.set()
+
+    def _shutdown_complete(self, message: LifespanShutdownCompleteEvent) -> None:
+        self.shutdown.set()
+
+    def _startup_failed(self, message: LifespanStartupFailedEvent) -> None:
+        raise LifespanFailureError("startup", message["message"])
+
+    def _shutdown_failed(self, message: LifespanShutdownFailedEvent) -> None:
+        raise LifespanFailureError("shutdown", message["message"])
+
+
+_LIFESPAN_HANDLERS: Dict[str, Callable[[Lifespan, Any], None]] = {
+    "lifespan.startup.complete": Lifespan._startup_complete,
+    "lifespan.shutdown.complete": Lifespan._shutdown_complete,
+    "lifespan.startup.failed": Lifespan._startup_failed,
+    "lifespan.shutdown.failed": Lifespan._shutdown_failed,
+}
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import asyncio
 from functools import partial
-from typing import Callable, List
+from typing import Callable, Iterator, List
 
 import pytest
 import trio
 
-from hypercorn.app_wrappers import _build_environ, InvalidPathError, WSGIWrapper
+from hypercorn.app_wrappers import _build_environ, _cgi_name, InvalidPathError, WSGIWrapper
 from hypercorn.typing import ASGISendEvent, HTTPScope
 
 
@@ -56,7 +56,7 @@ async def test_wsgi_trio() -> None:
             "status": 200,
             "type": "http.response.start",
         },
-        {"body": bytearray(b""), "type": "http.response.body"},
+        {"body": b"", "type": "http.response.body"},
     ]
 
 
@@ -94,7 +94,7 @@ async def test_wsgi_asyncio(event_loop: asyncio.AbstractEventLoop) -> None:
             "status": 200,
             "type": "http.response.start",
         },
-        {"body": bytearray(b""), "type": "http.response.body"},
+        {"body": b"", "type": "http.response.body"},
     ]
 
 
@@ -127,10 +127,99 @@ async def test_max_body_size(event_loop: asyncio.AbstractEventLoop) -> None:
     await app(scope, queue.get, _send, partial(event_loop.run_in_executor, None))
     assert messages == [
         {"headers": [], "status": 400, "type": "http.response.start"},
-        {"body": bytearray(b""), "type": "http.response.body"},
+        {"body": b"", "type": "http.response.body"},
     ]
 
 
+@pytest.mark.asyncio
+async def test_wsgi_asyncio_chunked_body(event_loop: asyncio.AbstractEventLoop) -> None:
+    app = WSGIWrapper(echo_body, 2**16)
+    scope: HTTPScope = {
+        "http_version": "1.1",
+        "asgi": {},
+        "method": "POST",
+        "headers": [],
+        "path": "/",
+        "root_path": "",
+        "query_string": b"",
+        "raw_path": b"/",
+        "scheme": "http",
+        "type": "http",
+        "client": ("localhost", 80),
+        "server": None,
+        "extensions": {},
+    }
+    queue: asyncio.Queue = asyncio.Queue()
+    await queue.put({"type": "http.request", "body": b"ab", "more_body": True})
+    await queue.put({"type": "http.request", "body": b"cd", "more_body": True})
+    await queue.put({"type": "http.request", "body": b"e", "more_body": False})
+    messages: list = []
+
+    async def _send(message: ASGISendEvent) -> None:
+        messages.append(message)
+
+    await app(scope, queue.get, _send, partial(event_loop.run_in_executor, None))
+    assert messages == [
+        {
+            "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", b"5")],
+            "status": 200,
+            "type": "http.response.start",
+        },
+        {"body": b"abcde", "type": "http.response.body"},
+    ]
+    assert isinstance(messages[1]["body"], bytes)
+
+
+def test_run_app() -> None:
+    def app(environ: dict, start_response: Callable) -> Iterator[bytes]:
+        start_response("201 Created", [("X-Custom", "value")])
+        yield b"a"
+        yield environ["wsgi.input"].read()
+        yield b"c"
+
+    scope: HTTPScope = {
+        "http_version": "1.1",
+        "asgi": {},
+        "method": "POST",
+        "headers": [],
+        "path": "/",
+        "root_path": "",
+        "query_string": b"",
+        "raw_path": b"/",
+        "scheme": "http",
+        "type": "http",
+        "client": ("localhost", 80),
+        "server": None,
+        "extensions": {},
+    }
+    environ = _build_environ(scope, b"b")
+    assert WSGIWrapper(app, 2**16).run_app(environ) == (201, [(b"x-custom", b"value")], b"abc")
+
+
+def test_run_app_no_start_response() -> None:
+    def app(environ: dict, start_response: Callable) -> List[bytes]:
+        return [b"body"]
+
+    scope: HTTPScope = {
+        "http_version": "1.1",
+        "asgi": {},
+        "method": "GET",
+        "headers": [],
+        "path": "/",
+        "root_path": "",
+        "query_string": b"",
+        "raw_path": b"/",
+        "scheme": "http",
+        "type": "http",
+        "client": ("localhost", 80),
+        "server": None,
+        "extensions": {},
+    }
+    environ = _build_environ(scope, b"")
+    with pytest.raises(Exception, match="start_response"):
+        WSGIWrapper(app, 2**16).run_app(environ)
+
+
 def test_build_environ_encoding() -> None:
     scope: HTTPScope = {
         "http_version": "1.0",
@@ -170,3 +259,73 @@ def test_build_environ_root_path() -> None:
     }
     with pytest.raises(InvalidPathError):
         _build_environ(scope, b"")
+
+
+def test_build_environ_headers() -> None:
+    scope: HTTPScope = {
+        "http_version": "1.1",
+        "asgi": {},
+        "method": "POST",
+        "headers": [
+            (b"content-length", b"4"),
+            (b"content-type", b"text/plain"),
+            (b"x-forwarded-for", b"127.0.0.1"),
+            (b"x-custom-header", b"value"),
+            (b"accept", b"text/html"),
+            (b"accept", b"text/plain"),
+        ],
+        "path": "/",
+        "root_path": "",
+        "query_string": b"",
+        "raw_path": b"/",
+        "scheme": "http",
+        "type": "http",
+        "client": ("localhost", 80),
+        "server": None,
+        "extensions": {},
+    }
+    environ = _build_environ(scope, b"abcd")
+    assert environ["wsgi.input"].read() == b"abcd"
+    assert environ["SERVER_PROTOCOL"] == "HTTP/1.1"
+    assert environ["CONTENT_LENGTH"] == "4"
+    assert environ["CONTENT_TYPE"] == "text/plain"
+    assert environ["HTTP_X_FORWARDED_FOR"] == "127.0.0.1"
+    assert environ["HTTP_X_CUSTOM_HEADER"] == "value"
+    assert environ["HTTP_ACCEPT"] == "text/html,text/plain"
+
+
+@pytest.mark.parametrize(
+    "path, root_path, expected",
+    [("/", "", "/"), ("", "", "/"), ("/a/b", "", "/a/b"), ("/a/b", "/a", "/b"), ("/a", "/a", "/")],
+)
+def test_build_environ_path_info(path: str, root_path: str, expected: str) -> None:
+    scope: HTTPScope = {
+        "http_version": "1.1",
+        "asgi": {},
+        "method": "GET",
+        "headers": [],
+        "path": path,
+        "root_path": root_path,
+        "query_string": b"",
+        "raw_path": path.encode(),
+        "scheme": "http",
+        "type": "http",
+        "client": ("localhost", 80),
+        "server": None,
+        "extensions": {},
+    }
+    environ = _build_environ(scope, b"")
+    assert environ["SCRIPT_NAME"] == root_path
+    assert environ["PATH_INFO"] == expected
+
+
+@pytest.mark.parametrize(
+    "raw_name, expected",
+    [
+        (b"content-length", "CONTENT_LENGTH"),
+        (b"content-type", "CONTENT_TYPE"),
+        (b"x-custom-header", "HTTP_X_CUSTOM_HEADER"),
+    ],
+)
+def test_cgi_name(raw_name: bytes, expected: str) -> None:
+    assert _cgi_name(raw_name) == expected